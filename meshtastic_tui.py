@@ -2,13 +2,11 @@
 import argparse
 import asyncio
 import signal
-from datetime import datetime
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
-import meshtastic
-import meshtastic.serial_interface
-import meshtastic.ble_interface
-import serial.tools.list_ports
 from pubsub import pub
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Grid
@@ -27,28 +25,90 @@ from modals import (
     UserNameSetterScreen,
     UserSelectorScreen,
     SerialPortSelectorScreen,
+    list_serial_ports,
     BleDeviceSelectorScreen,
     NodeListScreen,
     RawMonitorScreen,
 )
 
-# Load CSS from external file
+# Stylesheet, loaded by Textual when the app starts
 CSS_FILE = Path(__file__).parent / "meshtastic_tui.css"
-with open(CSS_FILE, "r") as f:
-    APP_CSS = f.read()
 
 # ====== CONFIG ======
 SERIAL_PORT = None  # set explicitly if needed, e.g. "/dev/ttyUSB0"
 MAX_MESSAGES = 500
+REFRESH_INTERVAL = 1 / 30  # Seconds between message table redraws
+TRIM_BATCH = 50  # Extra rows allowed past MAX_MESSAGES before the table is trimmed
 # ====================
 
+# Port numbers carrying text messages (name, or raw enum value from older firmware)
+TEXT_PORTNUMS = frozenset({"TEXT_MESSAGE_APP", 1})
+
+# Friendly names for numeric config enum values, indexed by value
+DEVICE_ROLE_NAMES = (
+    "CLIENT",
+    "CLIENT_MUTE",
+    "ROUTER",
+    "ROUTER_CLIENT",
+    "REPEATER",
+    "TRACKER",
+    "SENSOR",
+    "TAK",
+    "CLIENT_HIDDEN",
+    "LOST_AND_FOUND",
+    "TAK_TRACKER",
+)
+PRESET_NAMES = tuple(sorted(RADIO_PRESETS, key=RADIO_PRESETS.get))
+REGION_NAMES = (
+    "UNSET",
+    "US",
+    "EU_433",
+    "EU_868",
+    "CN",
+    "JP",
+    "ANZ",
+    "KR",
+    "TW",
+    "RU",
+    "IN",
+    "NZ_865",
+    "TH",
+    "UA_433",
+    "UA_868",
+    "MY_433",
+    "MY_919",
+    "SG_923",
+)
+
+# Last (epoch second, "HH:MM:SS") pair, swapped as a whole so threads never see a torn pair
+_last_timestamp = (0, "")
+
+
+def _current_timestamp() -> str:
+    """Return the current local time as HH:MM:SS, formatting at most once per second."""
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _last_timestamp[1]
+
+
+def _enum_name(value, names: tuple) -> str:
+    """Return the friendly name for a config enum value."""
+    # Try to get name attribute first, otherwise use mapping
+    if hasattr(value, "name"):
+        return value.name
+    if isinstance(value, int) and 0 <= value < len(names):
+        return names[value]
+    return f"Unknown ({value})"
+
 
 class ChatMonitor(App):
     """A Textual app for monitoring Meshtastic messages."""
 
     TITLE = "Meshtastic Terminal"
     SUB_TITLE = "Nodes: 0"
-    CSS = APP_CSS
+    CSS_PATH = CSS_FILE
 
     BINDINGS = [
         Binding("s", "send_message", "Send Message", show=True),
@@ -91,12 +151,35 @@ class ChatMonitor(App):
         self.auto_reconnect_enabled = True  # Enable automatic reconnection
         self.reconnect_worker = None  # Track the reconnect worker
         self.stats_worker = None  # Track the stats update worker
-        self.last_packet_received = None  # Track last time we received any packet
+        self.last_packet_received = None  # Monotonic time of the last packet received
         self.selected_serial_port = None  # Track the selected serial port
         self.selected_ble_address = None  # Track the selected BLE device address
         self.auto_connect = auto_connect  # Whether to auto-connect to first port
         self.use_ble = use_ble  # Whether to use BLE instead of serial
-        self.message_metadata = []  # Store full message data including hop counts
+        # Store full message data including hop counts (oldest dropped automatically)
+        self.message_metadata = deque(maxlen=MAX_MESSAGES)
+        self._pending_rows = deque()  # Messages waiting for the next table redraw
+        # Packets handed over from the reader thread. Bounded so a stalled UI can
+        # never back up the reader; each packet adds at most one row, so packets
+        # dropped past MAX_MESSAGES would have scrolled out of the table anyway.
+        self._rx_queue = deque(maxlen=MAX_MESSAGES)
+        self._loop = None  # Event loop running the app (set on mount)
+        self._connected_event = asyncio.Event()  # Set when a connection is established
+        # Blocking meshtastic calls run here, one at a time, off the event loop
+        self._mesh_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="meshtastic"
+        )
+        self._refresh_scheduled = False  # Whether a table refresh is already pending
+        self._last_refresh = 0.0  # Monotonic time of the last table refresh
+        self._last_subtitle_key = None  # Stats the current subtitle was built from
+        self._table = None  # Widget handles, cached on mount
+        self._input_container = None
+        self._input_label = None
+        self._user_input = None
+        # Packet handlers by portnum (NODEINFO_APP is handled before registration)
+        self._portnum_handlers = {"TELEMETRY_APP": self._process_telemetry}
+        for portnum in TEXT_PORTNUMS:
+            self._portnum_handlers[portnum] = self._process_text_message
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -129,6 +212,17 @@ class ChatMonitor(App):
 
     def update_subtitle(self) -> None:
         """Update the subtitle with current stats."""
+        # Values are rounded as displayed, so sub-display jitter doesn't rebuild it
+        key = (
+            self.node_count,
+            round(self.channel_util, 1),
+            self.battery_level,
+            round(self.voltage, 2),
+        )
+        if key == self._last_subtitle_key:
+            return
+        self._last_subtitle_key = key
+
         parts = [f"Nodes: {self.node_count}"]
 
         if self.channel_util > 0:
@@ -145,22 +239,39 @@ class ChatMonitor(App):
 
     def _setup_table_columns(self) -> None:
         """Set up table columns based on show_hop_column state."""
-        table = self.query_one("#messages-table", DataTable)
+        table = self._table
         table.clear(columns=True)
 
+        # Columns are keyed by their metadata field so cells can be updated in place
+        table.add_column("Time", key="timestamp")
+        table.add_column("From", key="from")
+        table.add_column("To", key="to")
         if self.show_hop_column:
-            table.add_columns("Time", "From", "To", "Hops", "Message")
-        else:
-            table.add_columns("Time", "From", "To", "Message")
+            table.add_column("Hops", key="hops")
+        table.add_column("Message", key="message")
 
     def on_mount(self) -> None:
         """Set up the app when mounted."""
+        # Cache widget handles used on every message and input step
+        self._table = self.query_one("#messages-table", DataTable)
+        self._input_container = self.query_one("#input-container")
+        self._input_label = self.query_one("#input-label", Static)
+        self._user_input = self.query_one("#user-input", Input)
+
         # Set up the table
-        table = self.query_one("#messages-table", DataTable)
+        table = self._table
         table.cursor_type = "row"  # Enable row cursor for clicking
         table.zebra_stripes = True
         self._setup_table_columns()
 
+        # Refreshes are scheduled on this loop from any thread as messages arrive
+        self._loop = asyncio.get_running_loop()
+        self._schedule_refresh()
+
+        # Listen for meshtastic events for the life of the app; every interface
+        # publishes on the same topics, so reconnects don't need to resubscribe
+        self.subscribe_to_events()
+
         # Set initial node count (now that widgets are mounted)
         self.node_count = len(self.known_nodes)
 
@@ -197,40 +308,48 @@ class ChatMonitor(App):
 
     def subscribe_to_events(self) -> None:
         """Subscribe to pub/sub events (unsubscribes first to avoid duplicates)."""
+        self.unsubscribe_from_events()
+
+        # Now subscribe
+        pub.subscribe(self.on_connection, "meshtastic.connection.established")
+        pub.subscribe(self.on_disconnect, "meshtastic.connection.lost")
+        pub.subscribe(self.on_receive, "meshtastic.receive")
+
+    def unsubscribe_from_events(self) -> None:
+        """Unsubscribe from pub/sub events."""
         try:
-            # Unsubscribe first to avoid duplicate subscriptions
             pub.unsubscribe(self.on_connection, "meshtastic.connection.established")
             pub.unsubscribe(self.on_disconnect, "meshtastic.connection.lost")
             pub.unsubscribe(self.on_receive, "meshtastic.receive")
         except Exception:
             pass  # Ignore if not subscribed
 
-        # Now subscribe
-        pub.subscribe(self.on_connection, "meshtastic.connection.established")
-        pub.subscribe(self.on_disconnect, "meshtastic.connection.lost")
-        pub.subscribe(self.on_receive, "meshtastic.receive")
-
-    def _normalize_node_id(self, packet) -> Optional[str]:
+    def _normalize_node_id(
+        self, packet: dict, id_key: str = "fromId", num_key: str = "from"
+    ) -> Optional[str]:
         """
         Extract and normalize node ID from packet to string format.
 
         Args:
-            packet: The packet dictionary containing 'fromId'/'from' or 'toId'/'to'
+            packet: The received packet dictionary
+            id_key: Key of the string ID ('fromId' or 'toId')
+            num_key: Key of the numeric ID ('from' or 'to')
 
         Returns:
             Normalized string ID (e.g., "!9bb3634b") or None if not found
         """
-        # Try string ID first (fromId or toId)
-        node_id = packet.get("fromId") or packet.get("toId")
+        # Try string ID first
+        node_id = packet.get(id_key)
         if node_id:
             return node_id
 
-        # Fall back to numeric ID (from or to)
-        node_num = packet.get("from") or packet.get("to")
+        # Fall back to numeric ID
+        node_num = packet.get(num_key)
         if node_num:
             # Try to look up in nodesByNum for proper ID
-            if hasattr(self.iface, "nodesByNum") and node_num in self.iface.nodesByNum:
-                node_info = self.iface.nodesByNum[node_num]
+            nodes_by_num = getattr(self.iface, "nodesByNum", None)
+            if nodes_by_num and node_num in nodes_by_num:
+                node_info = nodes_by_num[node_num]
                 return node_info.get("user", {}).get("id") or f"!{node_num:08x}"
             else:
                 return f"!{node_num:08x}"
@@ -256,16 +375,21 @@ class ChatMonitor(App):
         if not node_id:
             return "unknown"
 
+        # Broadcast addresses (e.g. "^all") never have a node entry
+        if node_id.startswith("^"):
+            return node_id
+
         # Try cache first if enabled
         if use_cache:
-            cached_name = self.known_nodes.get(node_id, {}).get("name")
-            if cached_name and cached_name != node_id:
-                return cached_name
+            known = self.known_nodes.get(node_id)
+            if known and known["name"] != node_id:
+                return known["name"]
 
         # Fallback to interface's node database
         friendly_name = None
-        if hasattr(self.iface, "nodes") and self.iface and node_id in self.iface.nodes:
-            user_info = self.iface.nodes[node_id].get("user", {})
+        nodes = getattr(self.iface, "nodes", None)
+        if nodes and node_id in nodes:
+            user_info = nodes[node_id].get("user", {})
             friendly_name = user_info.get("longName") or user_info.get("shortName")
 
             # Cache it for future lookups
@@ -274,22 +398,27 @@ class ChatMonitor(App):
 
         return friendly_name or node_id
 
-    def register_node(self, node_id: str, node_name: str = None) -> bool:
+    def register_node(
+        self, node_id: str, node_name: str = None, update_count: bool = True
+    ) -> bool:
         """
         Register a node and return True if it's newly discovered.
 
         Args:
             node_id: The node ID (e.g., "!9e9f4220")
             node_name: Optional friendly name for the node
+            update_count: Whether to update node_count (and so the subtitle) now;
+                bulk loaders pass False and set it once at the end
 
         Returns:
             True if this is a newly discovered node, False if already known
         """
-        is_new = node_id not in self.known_nodes
+        existing = self.known_nodes.get(node_id)
+        is_new = existing is None
 
         # Determine the best name to use
         # Priority: new non-trivial name > existing name > node_id
-        existing_name = self.known_nodes.get(node_id, {}).get("name")
+        existing_name = existing["name"] if existing else None
 
         # Only update name if new name is better than existing
         if node_name and node_name != node_id:
@@ -302,30 +431,30 @@ class ChatMonitor(App):
             # Fall back to node_id
             best_name = node_id
 
+        # Seen times are epoch seconds; format them only where they're displayed
+        now = time.time()
+        if existing:
+            # Update in place; most calls are a known node being seen again
+            existing["name"] = best_name
+            existing["last_seen"] = now
+            return False
+
         self.known_nodes[node_id] = {
             "name": best_name,
-            "last_seen": datetime.now().isoformat(),
-            "first_seen": self.known_nodes.get(node_id, {}).get(
-                "first_seen", datetime.now().isoformat()
-            ),
+            "last_seen": now,
+            "first_seen": now,
         }
 
         # Update node count
-        self.node_count = len(self.known_nodes)
+        if update_count:
+            self.node_count = len(self.known_nodes)
 
         return is_new
 
     def auto_connect_first_port(self) -> None:
         """Auto-connect to the first available serial port."""
-        # Get available serial ports
-        ports = serial.tools.list_ports.comports()
-
-        # Filter out typical non-device ports
-        filtered_ports = [
-            p
-            for p in ports
-            if not any(skip in p.device.lower() for skip in ["bluetooth", "debug"])
-        ]
+        # Get available serial ports (typical non-device ports are filtered out)
+        filtered_ports = list_serial_ports()
 
         if filtered_ports:
             # Use the first available port
@@ -375,6 +504,25 @@ class ChatMonitor(App):
 
         self.push_screen(BleDeviceSelectorScreen(), handle_ble_selection)
 
+    def _open_interface(self):
+        """Open the BLE or serial interface (blocking, run in an executor).
+
+        The meshtastic package is slow to import, so the interface modules are
+        loaded here on first connect rather than at startup.
+        """
+        if self.use_ble:
+            import meshtastic.ble_interface
+
+            return meshtastic.ble_interface.BLEInterface(
+                address=self.selected_ble_address
+            )
+
+        import meshtastic.serial_interface
+
+        return meshtastic.serial_interface.SerialInterface(
+            devPath=self.selected_serial_port
+        )
+
     async def connect_device(self) -> None:
         """Connect to Meshtastic device."""
         if self.use_ble:
@@ -391,36 +539,22 @@ class ChatMonitor(App):
                 self.log_system("Connecting to device (auto-detect)...")
 
         try:
-            # Run blocking meshtastic operations in executor
-            loop = asyncio.get_event_loop()
+            self._connected_event.clear()
 
-            if self.use_ble:
-                # Connect via BLE
-                self.iface = await loop.run_in_executor(
-                    None,
-                    lambda: meshtastic.ble_interface.BLEInterface(
-                        address=self.selected_ble_address
-                    ),
-                )
-            else:
-                # Connect via Serial
-                self.iface = await loop.run_in_executor(
-                    None,
-                    lambda: meshtastic.serial_interface.SerialInterface(
-                        devPath=self.selected_serial_port
-                    ),
-                )
+            # Run blocking meshtastic operations in executor
+            self.iface = await self._loop.run_in_executor(
+                self._mesh_executor, self._open_interface
+            )
 
             self.log_system("Initializing connection...")
 
-            # Subscribe to events
-            self.subscribe_to_events()
-
             # Wait a moment for connection
-            await asyncio.sleep(2)
+            await self._wait_for_connection(2)
 
             # Get node info
-            info = await loop.run_in_executor(None, self.iface.getMyNodeInfo)
+            info = await self._loop.run_in_executor(
+                self._mesh_executor, self.iface.getMyNodeInfo
+            )
             self.log_system(f"Ready: {info['user']['longName']}")
 
             # Store our node ID early (needed for registration logic)
@@ -444,9 +578,12 @@ class ChatMonitor(App):
                                 "shortName"
                             )
                             # Register node from device database using consistent method
-                            self.register_node(node_id, node_name)
+                            self.register_node(node_id, node_name, update_count=False)
                             node_count += 1
 
+                    # One subtitle update for the whole node database
+                    self.node_count = len(self.known_nodes)
+
                     self.log_system(
                         f"Loaded {node_count} node{'s' if node_count != 1 else ''} from device"
                     )
@@ -458,105 +595,39 @@ class ChatMonitor(App):
             # Log radio configuration
             try:
                 # Get the modem preset/config
-                if hasattr(self.iface, "localNode") and self.iface.localNode:
-                    local_config = self.iface.localNode.localConfig
-
+                local_node = getattr(self.iface, "localNode", None)
+                local_config = getattr(local_node, "localConfig", None)
+                if local_config:
                     # Log device role/mode
-                    if local_config and hasattr(local_config, "device"):
-                        device_config = local_config.device
-                        if hasattr(device_config, "role"):
-                            role_value = device_config.role
-                            # Map numeric role to friendly name
-                            role_names = {
-                                0: "CLIENT",
-                                1: "CLIENT_MUTE",
-                                2: "ROUTER",
-                                3: "ROUTER_CLIENT",
-                                4: "REPEATER",
-                                5: "TRACKER",
-                                6: "SENSOR",
-                                7: "TAK",
-                                8: "CLIENT_HIDDEN",
-                                9: "LOST_AND_FOUND",
-                                10: "TAK_TRACKER",
-                            }
-                            # Try to get name attribute first, otherwise use mapping
-                            if hasattr(role_value, "name"):
-                                role_name = role_value.name
-                            else:
-                                role_name = role_names.get(
-                                    role_value, f"Unknown ({role_value})"
-                                )
-                            self.log_system(f"Device mode: {role_name}")
-
-                    if local_config and hasattr(local_config, "lora"):
-                        lora_config = local_config.lora
-                        if hasattr(lora_config, "modem_preset"):
-                            preset_value = lora_config.modem_preset
-                            # Map numeric preset to friendly name
-                            preset_names = {
-                                0: "LONG_FAST",
-                                1: "LONG_SLOW",
-                                2: "VERY_LONG_SLOW",
-                                3: "MEDIUM_SLOW",
-                                4: "MEDIUM_FAST",
-                                5: "SHORT_SLOW",
-                                6: "SHORT_FAST",
-                                7: "LONG_MODERATE",
-                            }
-                            # Try to get name attribute first, otherwise use mapping
-                            if hasattr(preset_value, "name"):
-                                preset_name = preset_value.name
-                            else:
-                                preset_name = preset_names.get(
-                                    preset_value, f"Unknown ({preset_value})"
-                                )
-                            self.current_preset = preset_name
-                            self.log_system(f"Radio preset: {preset_name}")
-
-                        # Also log frequency slot if available
-                        if hasattr(lora_config, "channel_num"):
-                            channel_num = lora_config.channel_num
-                            self.current_frequency_slot = channel_num
-                            slot_display = (
-                                f"{channel_num} (auto)"
-                                if channel_num == 0
-                                else str(channel_num)
-                            )
-                            self.log_system(f"Frequency slot: {slot_display}")
-
-                        # Also log region if available
-                        if hasattr(lora_config, "region"):
-                            region_value = lora_config.region
-                            # Map numeric region to friendly name
-                            region_names = {
-                                0: "UNSET",
-                                1: "US",
-                                2: "EU_433",
-                                3: "EU_868",
-                                4: "CN",
-                                5: "JP",
-                                6: "ANZ",
-                                7: "KR",
-                                8: "TW",
-                                9: "RU",
-                                10: "IN",
-                                11: "NZ_865",
-                                12: "TH",
-                                13: "UA_433",
-                                14: "UA_868",
-                                15: "MY_433",
-                                16: "MY_919",
-                                17: "SG_923",
-                            }
-                            # Try to get name attribute first, otherwise use mapping
-                            if hasattr(region_value, "name"):
-                                region_name = region_value.name
-                            else:
-                                region_name = region_names.get(
-                                    region_value, f"Unknown ({region_value})"
-                                )
-                            self.log_system(f"Region: {region_name}")
+                    device_config = getattr(local_config, "device", None)
+                    role_value = getattr(device_config, "role", None)
+                    if role_value is not None:
+                        role_name = _enum_name(role_value, DEVICE_ROLE_NAMES)
+                        self.log_system(f"Device mode: {role_name}")
+
+                    lora_config = getattr(local_config, "lora", None)
+                    preset_value = getattr(lora_config, "modem_preset", None)
+                    if preset_value is not None:
+                        preset_name = _enum_name(preset_value, PRESET_NAMES)
+                        self.current_preset = preset_name
+                        self.log_system(f"Radio preset: {preset_name}")
+
+                    # Also log frequency slot if available
+                    channel_num = getattr(lora_config, "channel_num", None)
+                    if channel_num is not None:
+                        self.current_frequency_slot = channel_num
+                        slot_display = (
+                            f"{channel_num} (auto)"
+                            if channel_num == 0
+                            else str(channel_num)
+                        )
+                        self.log_system(f"Frequency slot: {slot_display}")
+
+                    # Also log region if available
+                    region_value = getattr(lora_config, "region", None)
+                    if region_value is not None:
+                        region_name = _enum_name(region_value, REGION_NAMES)
+                        self.log_system(f"Region: {region_name}")
             except Exception as e:
                 # Don't fail if we can't get radio config
                 pass
@@ -570,7 +641,11 @@ class ChatMonitor(App):
             self.log_system(f"FATAL: Could not connect: {e}", error=True)
 
     def on_connection(self, interface, topic=pub.AUTO_TOPIC):
-        """Handle connection event."""
+        """Handle connection event (called on a meshtastic thread)."""
+        self._loop.call_soon_threadsafe(self._handle_connection, interface)
+
+    def _handle_connection(self, interface) -> None:
+        """Update connection state on the event loop."""
         try:
             node = interface.getMyNodeInfo()
             self.my_node_id = node["user"]["id"]
@@ -580,6 +655,7 @@ class ChatMonitor(App):
 
             # Mark as connected
             self.is_connected = True
+            self._connected_event.set()
 
             # Stop any auto-reconnect attempts since we're now connected
             if self.is_reconnecting:
@@ -594,8 +670,19 @@ class ChatMonitor(App):
         except Exception as e:
             self.log_system(f"Connection warning: {e}")
 
+    async def _wait_for_connection(self, timeout: float) -> None:
+        """Wait for the connection event, giving up after timeout seconds."""
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass  # Carry on; getMyNodeInfo below will fail if we're not connected
+
     def on_disconnect(self, interface=None, topic=pub.AUTO_TOPIC):
-        """Handle disconnection event."""
+        """Handle disconnection event (may be called on a meshtastic thread)."""
+        self._loop.call_soon_threadsafe(self._handle_disconnect)
+
+    def _handle_disconnect(self) -> None:
+        """Update connection state and start reconnecting on the event loop."""
         # Prevent duplicate disconnect handling
         if self.is_disconnecting:
             return
@@ -605,11 +692,11 @@ class ChatMonitor(App):
         self.log_system("Disconnected from device", error=True)
 
         # Close the existing interface to prevent automatic reconnection
+        # (in an executor, since close() joins the interface's threads)
         if self.iface:
-            try:
-                self.iface.close()
-            except Exception:
-                pass
+            self._loop.run_in_executor(
+                self._mesh_executor, self._close_interface, self.iface
+            )
             self.iface = None
 
         # Start auto-reconnect if enabled and not already reconnecting
@@ -625,144 +712,156 @@ class ChatMonitor(App):
             )
 
         # Reset the disconnecting flag after a short delay to allow re-detection if needed
-        asyncio.create_task(self._reset_disconnect_flag())
+        self._loop.call_later(2, self._reset_disconnect_flag)
+
+    @staticmethod
+    def _close_interface(iface) -> None:
+        """Close an interface, ignoring errors from an already-dead connection."""
+        try:
+            iface.close()
+        except Exception:
+            pass
 
-    async def _reset_disconnect_flag(self) -> None:
-        """Reset the disconnecting flag after a brief delay."""
-        await asyncio.sleep(2)
+    def _reset_disconnect_flag(self) -> None:
+        """Reset the disconnecting flag (scheduled shortly after a disconnect)."""
         self.is_disconnecting = False
 
     def on_receive(self, packet, interface):
-        """Monitor received packets."""
+        """Queue received packets for processing on the UI thread."""
         # Update last packet timestamp for connection health monitoring
-        self.last_packet_received = datetime.now()
+        self.last_packet_received = time.monotonic()
 
-        decoded = packet.get("decoded", {})
+        # Called on the meshtastic reader thread; just hand the packet over
+        self._rx_queue.append(packet)
+        self._schedule_refresh()
+
+    def _handle_packet(self, packet) -> None:
+        """Process a received packet (runs on the UI thread)."""
+        decoded = packet.get("decoded") or {}
         portnum = decoded.get("portnum", "unknown")
 
         # Check for new nodes from sender only (not destination)
-        from_id = self._normalize_node_id(
-            {"fromId": packet.get("fromId"), "from": packet.get("from")}
-        )
-
-        if from_id and from_id != self.my_node_id and not from_id.startswith("^"):
-            # Register the node first (this tracks it even if we don't have a name yet)
-            is_new = self.register_node(from_id, None)
-
-            # Try to get a friendly name from the interface's node database
-            # This will work if the node info was already received previously
-            node_name = self.get_node_display_name(from_id, use_cache=False)
-
-            # If we got a friendly name (not just the ID), update the node and log discovery
-            if node_name != from_id:
-                self.register_node(from_id, node_name)
-                # Log discovery for newly seen nodes or nodes we just learned the name of
-                if is_new:
-                    self.log_node_discovery(from_id, node_name)
-
-        # Handle telemetry packets from our own node
-        if portnum == "TELEMETRY_APP" and from_id == self.my_node_id:
-            try:
-                telemetry = decoded.get("telemetry", {})
-
-                # Device metrics (battery, voltage, etc.)
-                if "deviceMetrics" in telemetry:
-                    metrics = telemetry["deviceMetrics"]
-                    if "batteryLevel" in metrics and metrics["batteryLevel"] > 0:
-                        self.battery_level = metrics["batteryLevel"]
-                    if "voltage" in metrics and metrics["voltage"] > 0:
-                        self.voltage = metrics["voltage"]
-                    if "channelUtilization" in metrics:
-                        self.channel_util = metrics["channelUtilization"]
-
-                # Air quality or environment metrics if available
-                # Can add more telemetry types here as needed
-            except Exception:
-                pass  # Ignore telemetry parsing errors
-
-            # Return early after handling telemetry - don't process as text message
-            return
+        from_id = self._normalize_node_id(packet)
 
-        # Skip non-text message types (these are handled above or not needed)
-        ignored_types = [
-            "POSITION_APP",
-            "TELEMETRY_APP",  # Already handled above
-            "ROUTING_APP",
-            "ADMIN_APP",
-            "unknown",
-        ]
+        is_remote = (
+            from_id and from_id != self.my_node_id and not from_id.startswith("^")
+        )
 
         # Handle NODEINFO_APP specially - this contains node name information
         if portnum == "NODEINFO_APP":
             # NODEINFO packets are the ideal time to discover nodes with friendly names
             # The meshtastic library updates iface.nodes automatically, so we can now
-            # get the friendly name and log discovery if this is a new node
-            if from_id and from_id != self.my_node_id and not from_id.startswith("^"):
-                # Process NODEINFO asynchronously to avoid blocking
-                self.run_worker(self._process_nodeinfo(from_id), exclusive=False)
+            # get the friendly name and log discovery if this is a new node.
+            # This must run before any other registration so it sees the old name.
+            if is_remote:
+                self._process_nodeinfo(from_id)
             return
 
-        if portnum in ignored_types:
+        if is_remote:
+            known = self.known_nodes.get(from_id)
+            if known is not None and known["name"] != from_id:
+                # Already have a friendly name; just mark the node as seen
+                self.register_node(from_id, None)
+            else:
+                # Register the node first (this tracks it even if we don't have a name yet)
+                is_new = self.register_node(from_id, None)
+
+                # Try to get a friendly name from the interface's node database
+                # This will work if the node info was already received previously
+                node_name = self.get_node_display_name(from_id, use_cache=False)
+
+                # If we got a friendly name (not just the ID), update the node and log discovery
+                if node_name != from_id:
+                    self.register_node(from_id, node_name)
+                    # Log discovery for newly seen nodes or nodes we just learned the name of
+                    if is_new:
+                        self.log_node_discovery(from_id, node_name)
+
+        # Route the packet by type; types without a handler don't produce a row
+        handler = self._portnum_handlers.get(portnum)
+        if handler is not None:
+            handler(packet, decoded, from_id)
+
+    def _process_telemetry(self, packet, decoded, from_id) -> None:
+        """Update device stats from a TELEMETRY_APP packet sent by our own node."""
+        if from_id != self.my_node_id:
             return
 
-        # Only process text messages
-        if portnum == "TEXT_MESSAGE_APP" or portnum == 1:
-            message_content = decoded.get("text")
-            if not message_content and "payload" in decoded:
+        try:
+            telemetry = decoded.get("telemetry", {})
+
+            # Device metrics (battery, voltage, etc.)
+            if "deviceMetrics" in telemetry:
+                metrics = telemetry["deviceMetrics"]
+                # Set the stats without firing each watcher, then rebuild
+                # the subtitle once for the whole packet
+                if "batteryLevel" in metrics and metrics["batteryLevel"] > 0:
+                    self.set_reactive(
+                        ChatMonitor.battery_level, metrics["batteryLevel"]
+                    )
+                if "voltage" in metrics and metrics["voltage"] > 0:
+                    self.set_reactive(ChatMonitor.voltage, metrics["voltage"])
+                if "channelUtilization" in metrics:
+                    self.set_reactive(
+                        ChatMonitor.channel_util, metrics["channelUtilization"]
+                    )
+                self.update_subtitle()
+
+            # Air quality or environment metrics if available
+            # Can add more telemetry types here as needed
+        except Exception:
+            pass  # Ignore telemetry parsing errors
+
+    def _process_text_message(self, packet, decoded, from_id) -> None:
+        """Add a text message packet to the message table."""
+        message_content = decoded.get("text")
+        if not message_content:
+            payload = decoded.get("payload")
+            if isinstance(payload, bytes):
                 try:
-                    payload = decoded["payload"]
-                    if isinstance(payload, bytes):
-                        message_content = payload.decode("utf-8")
-                    elif isinstance(payload, str):
-                        message_content = payload
-                except Exception:
+                    message_content = payload.decode("utf-8")
+                except UnicodeDecodeError:
                     return
+            elif isinstance(payload, str):
+                message_content = payload
 
-            if message_content:
-                # Extract and normalize sender/receiver IDs
-                msg_from_id = (
-                    self._normalize_node_id(
-                        {"fromId": packet.get("fromId"), "from": packet.get("from")}
-                    )
-                    or "unknown"
-                )
-                msg_to_id = (
-                    self._normalize_node_id(
-                        {"toId": packet.get("toId"), "to": packet.get("to")}
-                    )
-                    or "unknown"
-                )
+        if not message_content:
+            return
 
-                # Check if this is a reply (has replyId field)
-                reply_id = decoded.get("replyId") or packet.get("replyId")
-                is_reply = reply_id is not None and reply_id != 0
-
-                # Extract hop count (hopLimit - current hopStart gives hops taken)
-                hop_limit = packet.get("hopLimit", 0)
-                hop_start = packet.get("hopStart", hop_limit)
-                hops_taken = hop_start - hop_limit if hop_start >= hop_limit else 0
-
-                # Get packet ID for reply support
-                packet_id = packet.get("id", 0)
-
-                self.log_message(
-                    msg_from_id,
-                    msg_to_id,
-                    message_content,
-                    is_reply=is_reply,
-                    hop_count=hops_taken,
-                    packet_id=packet_id,
-                )
+        # Sender was already normalized above; only the receiver is left
+        msg_from_id = from_id or "unknown"
+        msg_to_id = self._normalize_node_id(packet, "toId", "to") or "unknown"
+
+        # Check if this is a reply (has replyId field)
+        reply_id = decoded.get("replyId") or packet.get("replyId")
+        is_reply = reply_id is not None and reply_id != 0
+
+        # Extract hop count (hopLimit - current hopStart gives hops taken)
+        hop_limit = packet.get("hopLimit", 0)
+        hop_start = packet.get("hopStart", hop_limit)
+        hops_taken = hop_start - hop_limit if hop_start >= hop_limit else 0
+
+        # Get packet ID for reply support
+        packet_id = packet.get("id", 0)
+
+        self.log_message(
+            msg_from_id,
+            msg_to_id,
+            message_content,
+            is_reply=is_reply,
+            hop_count=hops_taken,
+            packet_id=packet_id,
+        )
+
+    def _process_nodeinfo(self, from_id: str) -> None:
+        """Process NODEINFO packet to update node names.
 
-    async def _process_nodeinfo(self, from_id: str) -> None:
-        """Process NODEINFO packet asynchronously to update node names.
+        The meshtastic library updates iface.nodes before publishing the
+        packet, so the new name is already available by the time we get here.
 
         Args:
             from_id: The node ID from the NODEINFO packet
         """
-        # Wait a moment for the meshtastic library to update iface.nodes
-        await asyncio.sleep(0.1)
-
         # Get old name before fetching new one
         old_name = self.known_nodes.get(from_id, {}).get("name", from_id)
 
@@ -784,6 +883,74 @@ class ChatMonitor(App):
             # Log discovery when we learn the name
             self.log_node_discovery(from_id, node_name)
 
+    def _row_cells(self, msg: dict) -> tuple:
+        """Build the table cells for a message based on hop column visibility."""
+        if self.show_hop_column:
+            return (
+                msg["timestamp"],
+                msg["from"],
+                msg["to"],
+                msg["hops"],
+                msg["message"],
+            )
+        return (msg["timestamp"], msg["from"], msg["to"], msg["message"])
+
+    def _schedule_refresh(self) -> None:
+        """Request a table refresh (safe to call from any thread)."""
+        if self._refresh_scheduled or self._loop is None:
+            return
+        self._refresh_scheduled = True
+        self._loop.call_soon_threadsafe(self._start_refresh_timer)
+
+    def _start_refresh_timer(self) -> None:
+        """Run the refresh now, or as soon as a frame has passed since the last one."""
+        delay = self._last_refresh + REFRESH_INTERVAL - time.monotonic()
+        self._loop.call_later(max(delay, 0), self._on_refresh_tick)
+
+    def _on_refresh_tick(self) -> None:
+        """Process queued packets, then redraw the table once."""
+        # Clear the flag first so anything queued from here on schedules a new refresh
+        self._refresh_scheduled = False
+        self._last_refresh = time.monotonic()
+
+        # Nothing has arrived since the last frame
+        if not self._rx_queue and not self._pending_rows:
+            return
+
+        while self._rx_queue:
+            self._handle_packet(self._rx_queue.popleft())
+
+        self._flush_pending_rows()
+
+    def _flush_pending_rows(self) -> None:
+        """Add all queued messages to the table in a single redraw."""
+        if not self._pending_rows:
+            return
+
+        # Hold screen updates until the whole batch is in
+        with self.batch_update():
+            table = self._table
+            while self._pending_rows:
+                msg = self._pending_rows.popleft()
+                msg["row_key"] = table.add_row(*self._row_cells(msg))
+
+            # Keep only last MAX_MESSAGES. Every remove_row re-indexes all remaining
+            # rows, so rather than dropping one row per message, let the table run
+            # TRIM_BATCH rows over and then rebuild it from the (already capped)
+            # metadata in one pass.
+            if table.row_count > MAX_MESSAGES + TRIM_BATCH:
+                self._rebuild_table_rows()
+
+            # Scroll to bottom once for the whole batch
+            table.scroll_end(animate=False)
+
+    def _rebuild_table_rows(self) -> None:
+        """Redraw every table row from message metadata."""
+        table = self._table
+        table.clear()
+        for msg in self.message_metadata:
+            msg["row_key"] = table.add_row(*self._row_cells(msg))
+
     def _update_message_table_names(self, node_id: str, new_name: str) -> None:
         """Update message table to replace old node ID with new friendly name.
 
@@ -791,31 +958,17 @@ class ChatMonitor(App):
             node_id: The raw node ID (e.g., "!9e9f4220")
             new_name: The friendly name to replace it with
         """
-        table = self.query_one("#messages-table", DataTable)
-
-        # Update metadata
-        for msg in self.message_metadata:
-            if msg["from"] == node_id:
-                msg["from"] = new_name
-            if msg["to"] == node_id:
-                msg["to"] = new_name
+        table = self._table
 
-        # Rebuild the table with updated names
-        table.clear()
+        # Update metadata and only the affected cells (queued rows that haven't
+        # been drawn yet have no row key and pick up the new name when drawn)
         for msg in self.message_metadata:
-            if self.show_hop_column:
-                table.add_row(
-                    msg["timestamp"],
-                    msg["from"],
-                    msg["to"],
-                    msg["hops"],
-                    msg["message"],
-                )
-            else:
-                table.add_row(msg["timestamp"], msg["from"], msg["to"], msg["message"])
-
-        # Scroll to bottom
-        table.scroll_end(animate=False)
+            row_key = msg.get("row_key")
+            for column in ("from", "to"):
+                if msg[column] == node_id:
+                    msg[column] = new_name
+                    if row_key is not None:
+                        table.update_cell(row_key, column, new_name, update_width=True)
 
     def log_message(
         self,
@@ -827,16 +980,10 @@ class ChatMonitor(App):
         packet_id: int = 0,
     ):
         """Add a message to the table."""
-        if not content or not content.strip():
+        if not content or content.isspace():
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        table = self.query_one("#messages-table", DataTable)
-
-        # Apply styling based on sender
-        from_style = "from-me" if from_id == self.my_node_id else ""
-        to_style = "from-me" if to_id == self.my_node_id else ""
+        timestamp = _current_timestamp()
 
         # Get display names using centralized helper
         from_display = self.get_node_display_name(from_id)
@@ -848,75 +995,49 @@ class ChatMonitor(App):
             content = "↩ " + content
 
         # Store complete metadata (always preserve hop count and reply info)
-        self.message_metadata.append(
-            {
-                "timestamp": timestamp,
-                "from": from_display,
-                "to": to_display,
-                "from_id": from_id,  # Store raw node ID for replies
-                "to_id": to_id,  # Store raw destination for replies
-                "hops": str(hop_count),
-                "message": content,
-                "packet_id": packet_id,  # Store packet ID for replies
-            }
-        )
-
-        # Add row with or without hop count based on column visibility
-        if self.show_hop_column:
-            table.add_row(timestamp, from_display, to_display, str(hop_count), content)
-        else:
-            table.add_row(timestamp, from_display, to_display, content)
-
-        # Keep only last MAX_MESSAGES
-        if table.row_count > MAX_MESSAGES:
-            table.remove_row(table.rows[0].key)
-            self.message_metadata.pop(0)
+        msg = {
+            "timestamp": timestamp,
+            "from": from_display,
+            "to": to_display,
+            "from_id": from_id,  # Store raw node ID for replies
+            "to_id": to_id,  # Store raw destination for replies
+            "hops": str(hop_count),
+            "message": content,
+            "packet_id": packet_id,  # Store packet ID for replies
+        }
+        self.message_metadata.append(msg)
 
-        # Scroll to bottom
-        table.scroll_end(animate=False)
+        # Queue the row; it is drawn on the next refresh tick
+        self._pending_rows.append(msg)
+        self._schedule_refresh()
 
     def log_system(self, message: str, error: bool = False):
         """Add a system message to the table."""
-        if not message or not message.strip():
+        if not message or message.isspace():
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        table = self.query_one("#messages-table", DataTable)
-
-        style_class = "error-message" if error else "system-message"
+        timestamp = _current_timestamp()
 
         # Store complete metadata
-        self.message_metadata.append(
-            {
-                "timestamp": timestamp,
-                "from": "[SYSTEM]",
-                "to": "",
-                "from_id": "[SYSTEM]",
-                "to_id": "",
-                "hops": "",
-                "message": message,
-                "packet_id": 0,
-            }
-        )
-
-        # Add row with or without hop count based on column visibility
-        if self.show_hop_column:
-            table.add_row(timestamp, "[SYSTEM]", "", "", message)
-        else:
-            table.add_row(timestamp, "[SYSTEM]", "", message)
-
-        # Keep only last MAX_MESSAGES
-        if table.row_count > MAX_MESSAGES:
-            table.remove_row(table.rows[0].key)
-            self.message_metadata.pop(0)
+        msg = {
+            "timestamp": timestamp,
+            "from": "[SYSTEM]",
+            "to": "",
+            "from_id": "[SYSTEM]",
+            "to_id": "",
+            "hops": "",
+            "message": message,
+            "packet_id": 0,
+        }
+        self.message_metadata.append(msg)
 
-        # Scroll to bottom
-        table.scroll_end(animate=False)
+        # Queue the row; it is drawn on the next refresh tick
+        self._pending_rows.append(msg)
+        self._schedule_refresh()
 
     def log_node_discovery(self, node_id: str, node_name: str):
         """Add a node discovery event to the table."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        table = self.query_one("#messages-table", DataTable)
+        timestamp = _current_timestamp()
 
         # Show both friendly name and node ID for clarity
         if node_name and node_name != node_id:
@@ -925,32 +1046,21 @@ class ChatMonitor(App):
             message = f"Discovered: {node_id}"
 
         # Store complete metadata
-        self.message_metadata.append(
-            {
-                "timestamp": timestamp,
-                "from": "[NODE]",
-                "to": node_id,
-                "from_id": "[NODE]",
-                "to_id": node_id,
-                "hops": "",
-                "message": message,
-                "packet_id": 0,
-            }
-        )
-
-        # Add row with or without hop count based on column visibility
-        if self.show_hop_column:
-            table.add_row(timestamp, "[NODE]", node_id, "", message)
-        else:
-            table.add_row(timestamp, "[NODE]", node_id, message)
-
-        # Keep only last MAX_MESSAGES
-        if table.row_count > MAX_MESSAGES:
-            table.remove_row(table.rows[0].key)
-            self.message_metadata.pop(0)
+        msg = {
+            "timestamp": timestamp,
+            "from": "[NODE]",
+            "to": node_id,
+            "from_id": "[NODE]",
+            "to_id": node_id,
+            "hops": "",
+            "message": message,
+            "packet_id": 0,
+        }
+        self.message_metadata.append(msg)
 
-        # Scroll to bottom
-        table.scroll_end(animate=False)
+        # Queue the row; it is drawn on the next refresh tick
+        self._pending_rows.append(msg)
+        self._schedule_refresh()
 
     def action_send_message(self) -> None:
         """Start the message sending flow."""
@@ -961,14 +1071,14 @@ class ChatMonitor(App):
         self.current_input_step = "dest"
 
         # Show input container
-        container = self.query_one("#input-container")
+        container = self._input_container
         container.add_class("visible")
 
         # Update label and focus input
-        label = self.query_one("#input-label", Static)
+        label = self._input_label
         label.update("Destination [^all]:")
 
-        input_widget = self.query_one("#user-input", Input)
+        input_widget = self._user_input
         input_widget.value = ""
         input_widget.placeholder = "^all"
         input_widget.focus()
@@ -1005,17 +1115,17 @@ class ChatMonitor(App):
         self.dest_input = dest_node_id  # Pre-set destination
 
         # Show input container
-        container = self.query_one("#input-container")
+        container = self._input_container
         container.add_class("visible")
 
         # Get display name for the label
         dest_name = self.known_nodes.get(dest_node_id, {}).get("name", dest_node_id)
 
         # Update label and focus input
-        label = self.query_one("#input-label", Static)
+        label = self._input_label
         label.update(f"Message to {dest_name}:")
 
-        input_widget = self.query_one("#user-input", Input)
+        input_widget = self._user_input
         input_widget.value = ""
         input_widget.placeholder = "Type your message..."
         input_widget.focus()
@@ -1066,7 +1176,7 @@ class ChatMonitor(App):
             dest_display = self.get_node_display_name(original_to)
 
         # Show input container
-        container = self.query_one("#input-container")
+        container = self._input_container
         container.add_class("visible")
 
         # Truncate message preview if too long
@@ -1077,12 +1187,12 @@ class ChatMonitor(App):
         )
 
         # Update label and focus input
-        label = self.query_one("#input-label", Static)
+        label = self._input_label
         label.update(
             f'Reply to {original_from_display} → {dest_display}: "{msg_preview}"'
         )
 
-        input_widget = self.query_one("#user-input", Input)
+        input_widget = self._user_input
         input_widget.value = ""
         input_widget.placeholder = "Type your reply..."
         input_widget.focus()
@@ -1100,10 +1210,10 @@ class ChatMonitor(App):
             self.dest_input = value if value else "^all"
             self.current_input_step = "message"
 
-            label = self.query_one("#input-label", Static)
+            label = self._input_label
             label.update("Message:")
 
-            input_widget = self.query_one("#user-input", Input)
+            input_widget = self._user_input
             input_widget.value = ""
             input_widget.placeholder = "Type your message..."
 
@@ -1137,8 +1247,6 @@ class ChatMonitor(App):
             reply_id: Optional packet ID to reply to
         """
         try:
-            loop = asyncio.get_event_loop()
-
             # Determine if this is a direct message (to a specific node) vs broadcast
             # Direct messages should use wantAck=True for delivery confirmation
             is_broadcast = dest.startswith("^")  # Channels start with ^
@@ -1146,15 +1254,15 @@ class ChatMonitor(App):
 
             # Send with or without reply ID
             if reply_id:
-                await loop.run_in_executor(
-                    None,
+                await self._loop.run_in_executor(
+                    self._mesh_executor,
                     lambda: self.iface.sendText(
                         message, destinationId=dest, wantAck=want_ack, replyId=reply_id
                     ),
                 )
             else:
-                await loop.run_in_executor(
-                    None,
+                await self._loop.run_in_executor(
+                    self._mesh_executor,
                     lambda: self.iface.sendText(
                         message, destinationId=dest, wantAck=want_ack
                     ),
@@ -1190,11 +1298,11 @@ class ChatMonitor(App):
         self.reply_to_channel = None
 
         # Hide input container
-        container = self.query_one("#input-container")
+        container = self._input_container
         container.remove_class("visible")
 
         # Clear input
-        input_widget = self.query_one("#user-input", Input)
+        input_widget = self._user_input
         input_widget.value = ""
 
     @on(DataTable.RowSelected, "#messages-table")
@@ -1203,17 +1311,17 @@ class ChatMonitor(App):
         if not self.is_connected or self.input_mode:
             return
 
-        # Get the row index from the event
-        row_index = event.cursor_row
-
-        # Make sure we have metadata for this row
-        if row_index >= len(self.message_metadata):
+        # Find the metadata for this row (metadata may run ahead of the table
+        # while rows are queued, so match on row key rather than index)
+        msg_data = next(
+            (m for m in self.message_metadata if m.get("row_key") == event.row_key),
+            None,
+        )
+        if msg_data is None:
             return
 
-        msg_data = self.message_metadata[row_index]
-
         # Don't allow replying to system messages or discovery messages
-        if msg_data["from"] in ["[SYSTEM]", "[NODE]"]:
+        if msg_data["from"] in ("[SYSTEM]", "[NODE]"):
             return
 
         # Don't allow replying to our own messages
@@ -1287,26 +1395,18 @@ class ChatMonitor(App):
 
     def action_toggle_hop_column(self) -> None:
         """Toggle the visibility of the hop count column."""
-        table = self.query_one("#messages-table", DataTable)
+        # Draw anything still queued so the rebuild below doesn't duplicate it
+        self._flush_pending_rows()
 
         # Toggle the state
         self.show_hop_column = not self.show_hop_column
 
-        # Rebuild columns
-        self._setup_table_columns()
+        with self.batch_update():
+            # Rebuild columns
+            self._setup_table_columns()
 
-        # Restore all messages from metadata (which always has hop counts)
-        for msg in self.message_metadata:
-            if self.show_hop_column:
-                table.add_row(
-                    msg["timestamp"],
-                    msg["from"],
-                    msg["to"],
-                    msg["hops"],
-                    msg["message"],
-                )
-            else:
-                table.add_row(msg["timestamp"], msg["from"], msg["to"], msg["message"])
+            # Restore all messages from metadata (which always has hop counts)
+            self._rebuild_table_rows()
 
     def action_show_node_list(self) -> None:
         """Show the node list dialog."""
@@ -1352,8 +1452,6 @@ class ChatMonitor(App):
         self.log_system(f"Setting user names...")
 
         try:
-            loop = asyncio.get_event_loop()
-
             # Set the user names using the correct API
             def set_names():
                 try:
@@ -1369,7 +1467,7 @@ class ChatMonitor(App):
                 except Exception as e:
                     raise e
 
-            success = await loop.run_in_executor(None, set_names)
+            success = await self._loop.run_in_executor(self._mesh_executor, set_names)
 
             if success:
                 # Update our stored values
@@ -1402,8 +1500,6 @@ class ChatMonitor(App):
         self.log_system(f"Changing radio preset to {preset_name}...")
 
         try:
-            loop = asyncio.get_event_loop()
-
             # Set the preset using the correct API
             def set_preset():
                 try:
@@ -1418,7 +1514,7 @@ class ChatMonitor(App):
                 except Exception as e:
                     raise e
 
-            success = await loop.run_in_executor(None, set_preset)
+            success = await self._loop.run_in_executor(self._mesh_executor, set_preset)
 
             if success:
                 self.log_system(
@@ -1452,8 +1548,6 @@ class ChatMonitor(App):
         self.log_system(f"Changing frequency slot to {slot_display}...")
 
         try:
-            loop = asyncio.get_event_loop()
-
             # Set the frequency slot using the correct API
             def set_slot():
                 try:
@@ -1468,7 +1562,7 @@ class ChatMonitor(App):
                 except Exception as e:
                     raise e
 
-            success = await loop.run_in_executor(None, set_slot)
+            success = await self._loop.run_in_executor(self._mesh_executor, set_slot)
 
             if success:
                 slot_display = f"{slot} (auto)" if slot == 0 else str(slot)
@@ -1503,62 +1597,46 @@ class ChatMonitor(App):
             try:
                 # Close the old interface
                 if self.iface:
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, self.iface.close)
+                    await self._loop.run_in_executor(
+                        self._mesh_executor, self.iface.close
+                    )
                     self.iface = None
 
                 # Wait a bit before trying to reconnect
                 await asyncio.sleep(3)
 
-                # Try to reconnect
-                loop = asyncio.get_event_loop()
-                if self.use_ble:
-                    self.iface = await loop.run_in_executor(
-                        None,
-                        lambda: meshtastic.ble_interface.BLEInterface(
-                            address=self.selected_ble_address
-                        ),
-                    )
-                else:
-                    self.iface = await loop.run_in_executor(
-                        None,
-                        lambda: meshtastic.serial_interface.SerialInterface(
-                            devPath=self.selected_serial_port
-                        ),
-                    )
+                self._connected_event.clear()
 
-                # Re-subscribe to events
-                self.subscribe_to_events()
+                # Try to reconnect
+                self.iface = await self._loop.run_in_executor(
+                    self._mesh_executor, self._open_interface
+                )
 
                 # Wait for connection to stabilize
-                await asyncio.sleep(2)
+                await self._wait_for_connection(2)
 
                 # Verify connection
-                info = await loop.run_in_executor(None, self.iface.getMyNodeInfo)
+                info = await self._loop.run_in_executor(
+                    self._mesh_executor, self.iface.getMyNodeInfo
+                )
                 self.log_system(f"Reconnected: {info['user']['longName']}")
 
                 # Update current preset
                 try:
-                    if hasattr(self.iface, "localNode") and self.iface.localNode:
-                        local_config = self.iface.localNode.localConfig
-                        if local_config and hasattr(local_config, "lora"):
-                            lora_config = local_config.lora
-                            if hasattr(lora_config, "modem_preset"):
-                                preset_value = lora_config.modem_preset
-                                preset_names = {v: k for k, v in RADIO_PRESETS.items()}
-                                if hasattr(preset_value, "name"):
-                                    self.current_preset = preset_value.name
-                                else:
-                                    self.current_preset = preset_names.get(preset_value)
-                                self.log_system(
-                                    f"Verified preset: {self.current_preset}"
-                                )
-                            # Update current frequency slot
-                            if hasattr(lora_config, "channel_num"):
-                                self.current_frequency_slot = lora_config.channel_num
-                                self.log_system(
-                                    f"Verified frequency slot: {self.current_frequency_slot}"
-                                )
+                    local_node = getattr(self.iface, "localNode", None)
+                    local_config = getattr(local_node, "localConfig", None)
+                    lora_config = getattr(local_config, "lora", None)
+                    preset_value = getattr(lora_config, "modem_preset", None)
+                    if preset_value is not None:
+                        self.current_preset = _enum_name(preset_value, PRESET_NAMES)
+                        self.log_system(f"Verified preset: {self.current_preset}")
+                    # Update current frequency slot
+                    channel_num = getattr(lora_config, "channel_num", None)
+                    if channel_num is not None:
+                        self.current_frequency_slot = channel_num
+                        self.log_system(
+                            f"Verified frequency slot: {self.current_frequency_slot}"
+                        )
                 except Exception:
                     pass
 
@@ -1592,9 +1670,10 @@ class ChatMonitor(App):
 
                 # Close the old interface if it exists
                 if self.iface:
-                    loop = asyncio.get_event_loop()
                     try:
-                        await loop.run_in_executor(None, self.iface.close)
+                        await self._loop.run_in_executor(
+                            self._mesh_executor, self.iface.close
+                        )
                     except Exception:
                         pass
                     self.iface = None
@@ -1602,31 +1681,20 @@ class ChatMonitor(App):
                 # Wait a moment
                 await asyncio.sleep(2)
 
-                # Try to reconnect
-                loop = asyncio.get_event_loop()
-                if self.use_ble:
-                    self.iface = await loop.run_in_executor(
-                        None,
-                        lambda: meshtastic.ble_interface.BLEInterface(
-                            address=self.selected_ble_address
-                        ),
-                    )
-                else:
-                    self.iface = await loop.run_in_executor(
-                        None,
-                        lambda: meshtastic.serial_interface.SerialInterface(
-                            devPath=self.selected_serial_port
-                        ),
-                    )
+                self._connected_event.clear()
 
-                # Re-subscribe to events (important!)
-                self.subscribe_to_events()
+                # Try to reconnect
+                self.iface = await self._loop.run_in_executor(
+                    self._mesh_executor, self._open_interface
+                )
 
                 # Wait for connection to stabilize
-                await asyncio.sleep(3)
+                await self._wait_for_connection(3)
 
                 # Verify connection
-                info = await loop.run_in_executor(None, self.iface.getMyNodeInfo)
+                info = await self._loop.run_in_executor(
+                    self._mesh_executor, self.iface.getMyNodeInfo
+                )
                 self.log_system(f"Successfully reconnected: {info['user']['longName']}")
 
                 # Update node info
@@ -1662,10 +1730,10 @@ class ChatMonitor(App):
                     continue
 
                 # Check if connection has gone stale (no packets received recently)
-                if self.last_packet_received:
+                if self.last_packet_received is not None:
                     time_since_last_packet = (
-                        datetime.now() - self.last_packet_received
-                    ).total_seconds()
+                        time.monotonic() - self.last_packet_received
+                    )
 
                     if time_since_last_packet > stale_timeout_seconds:
                         self.log_system(
@@ -1680,8 +1748,6 @@ class ChatMonitor(App):
                         continue
 
                 # Request telemetry from the device (also serves as a lightweight keepalive)
-                loop = asyncio.get_event_loop()
-
                 def request_telemetry():
                     try:
                         self.iface.sendTelemetry(
@@ -1693,7 +1759,7 @@ class ChatMonitor(App):
                     except Exception:
                         pass
 
-                await loop.run_in_executor(None, request_telemetry)
+                await self._loop.run_in_executor(self._mesh_executor, request_telemetry)
 
             except asyncio.CancelledError:
                 # Worker cancelled, exit cleanly
@@ -1718,36 +1784,26 @@ class ChatMonitor(App):
             self.stats_worker = None
 
         # Unsubscribe from events
-        try:
-            pub.unsubscribe(self.on_connection, "meshtastic.connection.established")
-            pub.unsubscribe(self.on_disconnect, "meshtastic.connection.lost")
-            pub.unsubscribe(self.on_receive, "meshtastic.receive")
-        except Exception:
-            pass
+        self.unsubscribe_from_events()
 
-        # Close interface - for BLE use a quick timeout to avoid hanging
+        # Close interface with a timeout so a stuck device can't hang exit
         if self.iface:
+            iface, self.iface = self.iface, None
             try:
                 # Stop receive thread first
-                if hasattr(self.iface, "_want_receive"):
-                    self.iface._want_receive = False
+                if hasattr(iface, "_want_receive"):
+                    iface._want_receive = False
 
-                # For BLE, use a timeout to prevent hanging on disconnect
-                if self.use_ble:
-                    loop = asyncio.get_event_loop()
-                    try:
-                        await asyncio.wait_for(
-                            loop.run_in_executor(None, self.iface.close), timeout=1.0
-                        )
-                    except asyncio.TimeoutError:
-                        # Force close if timeout
-                        pass
-                else:
-                    # Serial can be closed normally
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, self.iface.close)
+                # Keep BLE, which is prone to hanging on disconnect, to a tighter cap
+                await asyncio.wait_for(
+                    self._loop.run_in_executor(self._mesh_executor, iface.close),
+                    timeout=1.0 if self.use_ble else 2.0,
+                )
             except Exception:
-                pass
+                pass  # Includes the timeout; we're exiting either way
+
+        # Don't wait on a close that timed out above
+        self._mesh_executor.shutdown(wait=False)
 
 
 def main():
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import time
 import sys
+import threading
 import meshtastic
 import meshtastic.serial_interface
 from meshtastic import BROADCAST_ADDR
@@ -13,6 +14,9 @@ SEND_INTERVAL = 10  # Delay seconds between sends
 SERIAL_PORT = None  # set explicitly if needed, e.g. "/dev/ttyUSB0"
 # ====================
 
+# Set from the pubsub thread on disconnect; the main loop exits when it's set
+shutdown_event = threading.Event()
+
 
 def on_connection(interface, topic=pub.AUTO_TOPIC):
     print(f"[INFO] Connected to Meshtastic device")
@@ -27,7 +31,8 @@ def on_connection(interface, topic=pub.AUTO_TOPIC):
 
 def on_disconnect(topic=pub.AUTO_TOPIC):
     print("[ERROR] Disconnected from device.")
-    sys.exit(1)
+    # sys.exit() here would only end the pubsub thread, so signal the main loop
+    shutdown_event.set()
 
 
 def on_receive(packet, interface):
@@ -113,7 +118,7 @@ def main():
     sent_packet_id = None
     attempt_count = 0
 
-    while not ack_received:
+    while not ack_received and not shutdown_event.is_set():
         try:
             attempt_count += 1
             # Create dynamic message with current attempt number
@@ -139,13 +144,18 @@ def main():
                 print(
                     f"[WARN] No ACK received within timeout for packet 0x{sent_packet_id:08x}, retrying in {SEND_INTERVAL}s..."
                 )
-                time.sleep(SEND_INTERVAL)
+                # Wait between attempts, but wake immediately on disconnect
+                shutdown_event.wait(SEND_INTERVAL)
 
         except Exception as e:
             print(f"[ERROR] Failed to send: {e}")
-            time.sleep(5)
+            shutdown_event.wait(5)
             continue
 
+    if shutdown_event.is_set():
+        iface.close()
+        sys.exit(1)
+
     print("[SUCCESS] Message confirmed delivered. Exiting.")
     iface.close()
 
@@ -5,7 +5,7 @@ from .frequency_slot_selector import FrequencySlotSelectorScreen
 from .quit_confirm import QuitConfirmScreen
 from .user_name_setter import UserNameSetterScreen
 from .user_selector import UserSelectorScreen
-from .serial_port_selector import SerialPortSelectorScreen
+from .serial_port_selector import SerialPortSelectorScreen, list_serial_ports
 from .ble_device_selector import BleDeviceSelectorScreen
 from .node_list import NodeListScreen
 from .node_detail import NodeDetailScreen
@@ -19,6 +19,7 @@ __all__ = [
     "UserNameSetterScreen",
     "UserSelectorScreen",
     "SerialPortSelectorScreen",
+    "list_serial_ports",
     "BleDeviceSelectorScreen",
     "NodeListScreen",
     "NodeDetailScreen",
@@ -7,7 +7,6 @@ from textual.containers import Container
 from textual.widgets import Button, Label, ListItem, ListView, Static
 from textual.screen import ModalScreen
 from textual import on
-from bleak import BleakScanner
 
 
 class BleDeviceSelectorScreen(ModalScreen):
@@ -62,6 +61,9 @@ class BleDeviceSelectorScreen(ModalScreen):
         self.device_info = {}
 
         try:
+            # Imported here so serial-only sessions never load bleak
+            from bleak import BleakScanner
+
             # Scan for 10 seconds
             devices = await BleakScanner.discover(timeout=10.0)
 
@@ -1,5 +1,7 @@
 """Frequency slot selector modal screen for Meshtastic TUI."""
 
+from typing import Optional
+
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import Button, Input, Label
@@ -22,6 +24,7 @@ class FrequencySlotSelectorScreen(ModalScreen):
         super().__init__()
         self.current_slot = current_slot
         self.button_list = []
+        self.freq_input = None  # Cached on mount
 
     def compose(self) -> ComposeResult:
         """Create the frequency slot selector dialog."""
@@ -50,38 +53,33 @@ class FrequencySlotSelectorScreen(ModalScreen):
                     yield Button("Set Slot", id="set-slot-button", variant="primary")
                     yield Button("Cancel", id="cancel-slot-button")
 
+    @staticmethod
+    def _parse_slot(value: str) -> Optional[int]:
+        """Return the slot number if the value is a valid slot, else None."""
+        try:
+            slot = int(value)
+        except ValueError:
+            return None
+        return slot if 0 <= slot <= 83 else None
+
     def on_mount(self) -> None:
         """Focus input when mounted."""
-        freq_input = self.query_one("#frequency-input", Input)
-        self.set_focus(freq_input)
+        self.freq_input = self.query_one("#frequency-input", Input)
+        self.set_focus(self.freq_input)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
         if event.button.id == "set-slot-button":
-            freq_input = self.query_one("#frequency-input", Input)
-            if freq_input.value:
-                try:
-                    slot = int(freq_input.value)
-                    if 0 <= slot <= 83:
-                        self.dismiss(slot)
-                    else:
-                        # Could add error message here
-                        pass
-                except ValueError:
-                    pass
+            self.action_select_button()
         elif event.button.id == "cancel-slot-button":
             self.dismiss(None)
 
     def action_select_button(self) -> None:
         """Handle enter key - same as clicking Set Slot button."""
-        freq_input = self.query_one("#frequency-input", Input)
-        if freq_input.value:
-            try:
-                slot = int(freq_input.value)
-                if 0 <= slot <= 83:
-                    self.dismiss(slot)
-            except ValueError:
-                pass
+        slot = self._parse_slot(self.freq_input.value)
+        if slot is not None:
+            self.dismiss(slot)
+        # Could add error message here for invalid slots
 
     def action_focus_previous(self) -> None:
         """Move focus to the previous element."""
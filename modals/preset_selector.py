@@ -43,15 +43,15 @@ class PresetSelectorScreen(ModalScreen):
             )
             yield Label(f"Select Radio Preset{current_text}", id="preset-title")
             with Grid(id="preset-buttons") as grid:
-                for preset_name in RADIO_PRESETS.keys():
-                    button = Button(preset_name, id=f"preset-{preset_name}")
-                    button.can_focus = True
-                    yield button
+                # Keep the buttons for navigation as they're created
+                self.button_list = [
+                    Button(preset_name, id=f"preset-{preset_name}")
+                    for preset_name in RADIO_PRESETS
+                ]
+                yield from self.button_list
 
     def on_mount(self) -> None:
         """Focus first button when mounted."""
-        # Store button list for navigation
-        self.button_list = list(self.query(Button))
         if self.button_list:
             # Focus the first button
             self.set_focus(self.button_list[0])
@@ -68,29 +68,24 @@ class PresetSelectorScreen(ModalScreen):
             preset_name = focused.id.replace("preset-", "")
             self.dismiss(preset_name)
 
-    def action_focus_previous(self) -> None:
-        """Move focus to the previous button."""
+    def _move_focus(self, delta: int) -> None:
+        """Move focus by delta buttons, wrapping around at either end."""
         if not self.button_list:
             return
 
         focused = self.focused
         if focused in self.button_list:
             current_index = self.button_list.index(focused)
-            # Move to previous button (wrap around to end if at start)
-            previous_index = (current_index - 1) % len(self.button_list)
-            self.set_focus(self.button_list[previous_index])
+            new_index = (current_index + delta) % len(self.button_list)
+            self.set_focus(self.button_list[new_index])
+
+    def action_focus_previous(self) -> None:
+        """Move focus to the previous button."""
+        self._move_focus(-1)
 
     def action_focus_next(self) -> None:
         """Move focus to the next button."""
-        if not self.button_list:
-            return
-
-        focused = self.focused
-        if focused in self.button_list:
-            current_index = self.button_list.index(focused)
-            # Move to next button (wrap around to start if at end)
-            next_index = (current_index + 1) % len(self.button_list)
-            self.set_focus(self.button_list[next_index])
+        self._move_focus(1)
 
     def action_dismiss_dialog(self) -> None:
         """Dismiss dialog without selecting."""
@@ -8,6 +8,14 @@ from textual.screen import ModalScreen
 from textual import on, events
 
 
+def list_serial_ports() -> list:
+    """Return the available serial ports, skipping Bluetooth and debug ports."""
+    return [
+        p for p in serial.tools.list_ports.comports()
+        if not any(skip in p.device.lower() for skip in ('bluetooth', 'debug'))
+    ]
+
+
 class SerialPortSelectorScreen(ModalScreen):
     """Modal screen for selecting a serial port to connect to."""
 
@@ -30,13 +38,7 @@ class SerialPortSelectorScreen(ModalScreen):
             yield Label("Select serial port:", id="port-selector-title")
             
             # Enumerate available serial ports
-            ports = serial.tools.list_ports.comports()
-            
-            # Filter out typical non-device ports
-            filtered_ports = [
-                p for p in ports 
-                if not any(skip in p.device.lower() for skip in ['bluetooth', 'debug'])
-            ]
+            filtered_ports = list_serial_ports()
             
             # Store port information
             for port in filtered_ports:
@@ -61,7 +63,7 @@ class SerialPortSelectorScreen(ModalScreen):
         if self.port_list:
             list_view = self.query_one("#port-list", ListView)
             # Add all list items
-            for device_path in self.port_list:
+            for index, device_path in enumerate(self.port_list):
                 port_info = self.port_info[device_path]
                 
                 # Create informative label
@@ -72,7 +74,7 @@ class SerialPortSelectorScreen(ModalScreen):
                 else:
                     label_text = device_path
                 
-                list_view.append(ListItem(Label(label_text), id=f"port_{self.port_list.index(device_path)}"))
+                list_view.append(ListItem(Label(label_text), id=f"port_{index}"))
             
             # Focus the list view
             self.set_focus(list_view)